@@ -0,0 +1,62 @@
+# cython: language_level=3
+"""
+Optional C accelerator for ShrmplLog frame formatting
+
+Build in place with `cythonize -i _shrmpl_log_frame.pyx`; shrmpl.py falls
+back to its pure Python formatter when this module is not built.
+"""
+
+from cpython.bytes cimport PyBytes_AS_STRING, PyBytes_FromStringAndSize
+from libc.string cimport memcpy, memset
+
+
+cdef inline char* _put(char* out, bytes src):
+    cdef Py_ssize_t n = len(src)
+    memcpy(out, PyBytes_AS_STRING(src), n)
+    return out + n
+
+
+cpdef bytes build_log_frame(str level, str host, str code, str message):
+    """Format [LVL(4)] [HOST(32)] [CODE(4)] [LEN(4)]: [MSG]\\n, raising ValueError on bad lengths"""
+    # The buffer size below assumes these bounds; never write past it
+    if len(level) != 4:
+        raise ValueError("Level must be exactly 4 characters")
+    if len(host) > 32:
+        raise ValueError("Host must be <= 32 characters")
+    if len(code) != 4:
+        raise ValueError("Code must be exactly 4 characters")
+    if len(message) > 4096:
+        raise ValueError("Message must be <= 4096 characters")
+
+    cdef bytes lvl = level.encode()
+    cdef bytes hst = host.encode()
+    cdef bytes cde = code.encode()
+    cdef bytes msg = message.encode()
+    cdef Py_ssize_t host_pad = 32 - len(host)  # ljust pads by characters
+    cdef Py_ssize_t msg_len = len(message)
+    cdef Py_ssize_t total = (1 + len(lvl) + 3 + len(hst) + host_pad + 3 + len(cde)
+                             + 3 + 4 + 3 + len(msg) + 1)
+
+    cdef bytes frame = PyBytes_FromStringAndSize(NULL, total)
+    cdef char* out = PyBytes_AS_STRING(frame)
+
+    out[0] = b'['
+    out = _put(out + 1, lvl)
+    memcpy(out, b"] [", 3)
+    out = _put(out + 3, hst)
+    memset(out, b' ', host_pad)
+    out += host_pad
+    memcpy(out, b"] [", 3)
+    out = _put(out + 3, cde)
+    memcpy(out, b"] [", 3)
+    out += 3
+
+    # Zero-padded length; messages are capped at 4096 characters above
+    out[0] = <char>(c'0' + msg_len // 1000 % 10)
+    out[1] = <char>(c'0' + msg_len // 100 % 10)
+    out[2] = <char>(c'0' + msg_len // 10 % 10)
+    out[3] = <char>(c'0' + msg_len % 10)
+    memcpy(out + 4, b"]: ", 3)
+    out = _put(out + 7, msg)
+    out[0] = b'\n'
+    return frame
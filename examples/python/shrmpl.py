@@ -6,11 +6,138 @@ Provides client classes for KV, Log, and Vault services.
 Each service maintains persistent connections and returns (result, error) tuples.
 """
 
+import asyncio
+import codecs
+import http.client
 import socket
 import ssl
-import urllib.request
-import urllib.error
-from typing import Optional, Tuple, Union
+import threading
+import time
+import urllib.parse
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    # Optional C log frame builder: cythonize -i _shrmpl_log_frame.pyx
+    from _shrmpl_log_frame import build_log_frame as _build_log_frame
+except ImportError:
+    _build_log_frame = None
+
+
+# Pre-encoded fixed KV commands
+_PING_BYTES = b"PING\n"
+_LIST_BYTES = b"LIST\n"
+
+# Exact-match KV responses that are reported as errors
+_SENTINEL = {
+    b"UPONG": (None, "Heartbeat received"),
+    b"TERM": (None, "Server shutting down"),
+}
+
+# Gathered writes (writev) are not available on every platform, e.g. Windows
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+
+# Initial size of the KV receive buffer; grows for large LIST responses
+_RECV_BUF_SIZE = 8192
+
+# Max key/value length; the server enforces the same limit and answers
+# "ERROR invalid length", so the client check is skipped under python -O
+_MAX_KV = 100
+
+# Read size when streaming vault config files
+_VAULT_CHUNK_SIZE = 64 * 1024
+
+# Max cached [LEVEL] [HOST] [CODE] [ log prefixes per ShrmplLog instance
+_LOG_PREFIX_CACHE_SIZE = 32
+
+
+def _configure_socket(sock: socket.socket):
+    """Apply low-latency, keepalive and buffer options to a client socket"""
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    
+    # Detect dead peers instead of waiting on retransmit timeouts
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)
+    if hasattr(socket, 'TCP_KEEPINTVL'):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+    if hasattr(socket, 'TCP_KEEPCNT'):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+    
+    # Larger buffers for LIST responses and log bursts (set before connect
+    # so the receive window scale is negotiated accordingly)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+    
+    # Low-latency QoS hints; best effort, as some platforms reject them
+    try:
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_TOS, 0x10)  # IPTOS_LOWDELAY
+    except (AttributeError, OSError):
+        pass
+    if hasattr(socket, 'SO_PRIORITY'):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_PRIORITY, 6)
+        except OSError:
+            pass
+
+
+def _parse_response(response: bytes) -> Tuple[Optional[bytes], Optional[str]]:
+    """Classify a raw KV response line into a (result, error) tuple"""
+    # Filter out heartbeats and shutdown notices
+    hit = _SENTINEL.get(response)
+    if hit is not None:
+        return hit
+    if response.startswith(b"ERROR"):
+        return None, response.decode('utf-8', 'replace')
+    return response, None
+
+
+def _check_pipeline(cmds: List[str]) -> Optional[str]:
+    """Reject commands that would not produce exactly one reply line"""
+    for cmd in cmds:
+        # The server ignores blank lines, and embedded newlines split a command
+        if not cmd.strip():
+            return "Empty command is not supported in a pipeline"
+        if '\n' in cmd or '\r' in cmd:
+            return "Newline in command is not supported in a pipeline"
+        # LIST replies span several lines
+        if cmd.split(None, 1)[0].upper() == "LIST":
+            return "LIST is not supported in a pipeline"
+    return None
+
+
+def _parse_int(result: bytes) -> Tuple[Optional[int], Optional[str]]:
+    """Parse an INCR reply, validating digits up front instead of catching ValueError"""
+    digits = result[1:] if result[:1] in (b'-', b'+') else result
+    if not digits.isdigit():
+        return None, f"Invalid response: {result.decode('utf-8', 'replace')}"
+    return int(result), None
+
+
+def _parse_list(lines: List[bytes]) -> list:
+    """Parse raw LIST rows into (key, value, expiration) tuples"""
+    items = []
+    
+    # Rows are KEY=VALUE,EXPIRATION; partition() splits in C without
+    # building intermediate lists or raising on non-numeric expirations.
+    # Rows stay bytes and only key/value are decoded; int() reads ASCII
+    # digits straight from bytes.
+    for line in lines:
+        if not line:
+            continue
+        
+        key, sep, value_and_expiration = line.partition(b'=')
+        if not sep:
+            continue
+        
+        value, sep, expiration_str = value_and_expiration.rpartition(b',')
+        if not sep:
+            continue
+        
+        expiration = int(expiration_str) if expiration_str.isdigit() else None
+        items.append((key.decode('utf-8', 'replace'), value.decode('utf-8', 'replace'), expiration))
+    
+    return items
 
 
 class ShrmplKV:
@@ -20,172 +147,572 @@ class ShrmplKV:
         self.host = host
         self.port = port
         self.socket = None
-        self.reader = None
-        self.writer = None
+        self._recv_buf = None
+        self._view = None
+        self._start = 0
+        self._end = 0
+        self._quickack = hasattr(socket, 'TCP_QUICKACK')
     
     def connect(self) -> Tuple[bool, Optional[str]]:
         """Connect to KV server"""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(5)
+            _configure_socket(self.socket)
             self.socket.connect((self.host, self.port))
-            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self._quickack:
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+            
+            # Responses land in one preallocated buffer via recv_into
+            self._recv_buf = bytearray(_RECV_BUF_SIZE)
+            self._view = memoryview(self._recv_buf)
+            self._start = 0
+            self._end = 0
             return True, None
         except Exception as e:
             return False, str(e)
     
-    def _send_command(self, command: str) -> Tuple[Optional[str], Optional[str]]:
+    def _read_line(self) -> bytes:
+        """Read one response line (without the trailing newline)"""
+        buf = self._recv_buf
+        while True:
+            # Bytes past a newline stay buffered for the next call (LIST rows)
+            nl = buf.find(b'\n', self._start, self._end)
+            if nl >= 0:
+                line = bytes(self._view[self._start:nl])
+                self._start = nl + 1
+                if self._start == self._end:
+                    self._start = self._end = 0
+                return line.rstrip(b'\r')
+            
+            # Move a partial line to the front, growing the buffer if it is full
+            if self._start:
+                pending = self._end - self._start
+                buf[:pending] = buf[self._start:self._end]
+                self._start, self._end = 0, pending
+            if self._end == len(buf):
+                self._view.release()
+                buf.extend(bytes(len(buf)))
+                self._view = memoryview(buf)
+            
+            n = self.socket.recv_into(self._view[self._end:])
+            if n == 0:
+                raise ConnectionError("Connection closed by server")
+            self._end += n
+    
+    def _sendmsg_cmd(self, parts: List[bytes]):
+        """Write command parts with one gathered send, without joining them first"""
+        if not _HAS_SENDMSG:
+            self.socket.sendall(b''.join(parts))
+            return
+        
+        sent = self.socket.sendmsg(parts)
+        if sent < sum(map(len, parts)):
+            # Short write; finish the remainder in one go
+            self.socket.sendall(b''.join(parts)[sent:])
+    
+    def _send_command(self, command: str) -> Tuple[Optional[bytes], Optional[str]]:
         """Send command and get response"""
+        return self._send_parts([command.encode(), b'\n'])
+    
+    def _send_bytes(self, cmd_bytes: bytes) -> Tuple[Optional[bytes], Optional[str]]:
+        """Send an encoded, newline-terminated command and get response"""
+        return self._send_parts([cmd_bytes])
+    
+    def _send_parts(self, parts: List[bytes]) -> Tuple[Optional[bytes], Optional[str]]:
+        """Send a command given as encoded parts and get response"""
         if not self.socket:
             return None, "Not connected"
         
         try:
             # Send command
-            self.socket.sendall(f"{command}\n".encode())
+            self._sendmsg_cmd(parts)
             
             # Read response
-            response = ""
-            while True:
-                chunk = self.socket.recv(1024).decode()
-                if not chunk:
-                    break
-                response += chunk
-                if response.endswith('\n'):
-                    break
+            response = self._read_line().strip()
             
-            response = response.strip()
+            # Kernel clears QUICKACK after receiving, so re-arm it
+            if self._quickack:
+                try:
+                    self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+                except OSError:
+                    pass
             
-            # Filter out heartbeats
-            if response == "UPONG":
-                return None, "Heartbeat received"
-            elif response == "TERM":
-                return None, "Server shutting down"
-            elif response.startswith("ERROR"):
-                return None, response
-            else:
-                return response, None
+            return _parse_response(response)
                 
         except Exception as e:
+            # Reply stream may be out of step; drop the socket so it isn't reused
+            self.close()
             return None, str(e)
     
+    def pipeline(self, cmds: List[str]) -> List[Tuple[Optional[str], Optional[str]]]:
+        """Send all commands in one write, then read one (result, error) per command"""
+        if not self.socket:
+            return [(None, "Not connected")] * len(cmds)
+        
+        error = _check_pipeline(cmds)
+        if error:
+            return [(None, error)] * len(cmds)
+        
+        results = []
+        try:
+            self.socket.sendall(b''.join(cmd.encode() + b'\n' for cmd in cmds))
+            
+            for _ in cmds:
+                result, error = _parse_response(self._read_line().strip())
+                results.append((result.decode('utf-8', 'replace') if result is not None else None, error))
+            
+            if self._quickack:
+                try:
+                    self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+                except OSError:
+                    pass
+        except Exception as e:
+            self.close()
+            results.extend([(None, str(e))] * (len(cmds) - len(results)))
+        return results
+    
     def get(self, key: str) -> Tuple[Optional[str], Optional[str]]:
         """Get value for key"""
-        if len(key) > 100:
+        if __debug__ and len(key) > _MAX_KV:
             return None, "Key length exceeds 100 characters"
         
-        result, error = self._send_command(f"GET {key}")
+        result, error = self._send_parts([b"GET ", key.encode(), b"\n"])
         if error:
             if "key not found" in str(error):
                 return None, None  # Key not found is not an error
             return None, error
-        return result, None
+        return result.decode('utf-8', 'replace'), None
     
     def set(self, key: str, value: str, ttl: Optional[str] = None) -> Tuple[bool, Optional[str]]:
         """Set key to value with optional TTL"""
-        if len(key) > 100 or len(value) > 100:
+        if __debug__ and (len(key) > _MAX_KV or len(value) > _MAX_KV):
             return False, "Key or value length exceeds 100 characters"
         
         if ttl:
-            command = f"SET {key} {value} {ttl}"
+            parts = [b"SET ", key.encode(), b" ", value.encode(), b" ", ttl.encode(), b"\n"]
         else:
-            command = f"SET {key} {value}"
+            parts = [b"SET ", key.encode(), b" ", value.encode(), b"\n"]
         
-        result, error = self._send_command(command)
+        result, error = self._send_parts(parts)
         if error:
             return False, error
-        return result == "OK", None
+        return result == b"OK", None
     
     def incr(self, key: str, ttl: Optional[str] = None) -> Tuple[Optional[int], Optional[str]]:
         """Increment integer value by 1 with optional TTL"""
-        if len(key) > 100:
+        if __debug__ and len(key) > _MAX_KV:
             return None, "Key length exceeds 100 characters"
         
         if ttl:
-            command = f"INCR {key} {ttl}"
+            parts = [b"INCR ", key.encode(), b" ", ttl.encode(), b"\n"]
         else:
-            command = f"INCR {key}"
+            parts = [b"INCR ", key.encode(), b"\n"]
         
-        result, error = self._send_command(command)
+        result, error = self._send_parts(parts)
         if error:
             return None, error
         
         if result is None:
             return None, "No response received"
         
-        try:
-            return int(result), None
-        except (ValueError, TypeError):
-            return None, f"Invalid response: {result}"
+        return _parse_int(result)
     
     def delete(self, key: str) -> Tuple[bool, Optional[str]]:
         """Delete key"""
-        if len(key) > 100:
+        if __debug__ and len(key) > _MAX_KV:
             return False, "Key length exceeds 100 characters"
         
-        result, error = self._send_command(f"DEL {key}")
+        result, error = self._send_parts([b"DEL ", key.encode(), b"\n"])
         if error:
             if "key not found" in str(error):
                 return False, None  # Key not found is not an error
             return False, error
-        return result == "OK", None
+        return result == b"OK", None
     
     def ping(self) -> Tuple[bool, Optional[str]]:
         """Ping server"""
-        result, error = self._send_command("PING")
+        result, error = self._send_bytes(_PING_BYTES)
         if error:
             return False, error
-        return result == "PONG", None
+        return result == b"PONG", None
     
     def list(self) -> Tuple[Optional[list], Optional[str]]:
         """List all keys with values and expiration timestamps"""
-        result, error = self._send_command("LIST")
+        result, error = self._send_bytes(_LIST_BYTES)
         if error:
             return None, error
         
         if result is None:
             return [], None
         
-        items = []
-        if result.strip() == "":
+        if result.strip() == b"":
             return [], None
         
-        for line in result.strip().split('\n'):
-            if line.strip() == "":
-                continue
-            
-            parts = line.split('=', 2)
-            if len(parts) != 3:
-                continue
-            
-            key = parts[0]
-            value_and_expiration = parts[2]
-            value_parts = value_and_expiration.split(',', 1)
-            
-            if len(value_parts) != 2:
-                continue
-            
-            value = value_parts[0]
-            expiration_str = value_parts[1]
-            
-            if expiration_str == "no-expiration":
-                expiration = None
-            else:
-                try:
-                    expiration = int(expiration_str)
-                except ValueError:
-                    expiration = None
-            
-            items.append((key, value, expiration))
+        # LIST spans multiple lines and is terminated by an empty line
+        lines = [result]
+        try:
+            while True:
+                line = self._read_line()
+                if line == b"":
+                    break
+                lines.append(line)
+        except Exception as e:
+            self.close()
+            return None, str(e)
         
-        return items, None
+        return _parse_list(lines), None
     
     def close(self):
         """Close connection"""
+        if self._view:
+            self._view.release()
+            self._view = None
+            self._recv_buf = None
         if self.socket:
             self.socket.close()
             self.socket = None
 
 
+class AsyncShrmplKV:
+    """asyncio client for Shrmpl KV Server"""
+    
+    def __init__(self, host: str, port: int, timeout: float = 5):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.reader = None
+        self.writer = None
+        self._sock = None
+        self._quickack = hasattr(socket, 'TCP_QUICKACK')
+        # Serialises write + read so concurrent tasks can share the connection
+        self._lock = asyncio.Lock()
+    
+    async def connect(self) -> Tuple[bool, Optional[str]]:
+        """Connect to KV server"""
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            _configure_socket(sock)
+            loop = asyncio.get_running_loop()
+            try:
+                await asyncio.wait_for(loop.sock_connect(sock, (self.host, self.port)), self.timeout)
+            except BaseException:
+                sock.close()
+                raise
+            if self._quickack:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+            self.reader, self.writer = await asyncio.open_connection(sock=sock)
+            self._sock = self.writer.get_extra_info('socket')
+            return True, None
+        except Exception as e:
+            return False, str(e)
+    
+    async def _read_line(self) -> bytes:
+        """Read one response line (without the trailing newline)"""
+        line = await asyncio.wait_for(self.reader.readline(), self.timeout)
+        if not line.endswith(b'\n'):
+            raise ConnectionError("Connection closed by server")
+        
+        # Kernel clears QUICKACK after receiving, so re-arm it
+        if self._quickack:
+            try:
+                self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+            except OSError:
+                pass
+        return line.rstrip(b'\r\n')
+    
+    def _abort(self):
+        """Drop the connection so a late reply can't reach the next caller"""
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+            self.reader = None
+            self._sock = None
+    
+    async def _send_bytes(self, cmd_bytes: bytes) -> Tuple[Optional[bytes], Optional[str]]:
+        """Send an encoded, newline-terminated command and get response"""
+        async with self._lock:
+            if not self.writer:
+                return None, "Not connected"
+            
+            try:
+                self.writer.write(cmd_bytes)
+                await self.writer.drain()
+                response = (await self._read_line()).strip()
+                return _parse_response(response)
+            except asyncio.CancelledError:
+                self._abort()
+                raise
+            except Exception as e:
+                self._abort()
+                return None, str(e)
+    
+    async def pipeline(self, cmds: List[str]) -> List[Tuple[Optional[str], Optional[str]]]:
+        """Send all commands in one write, then read one (result, error) per command"""
+        if not self.writer:
+            return [(None, "Not connected")] * len(cmds)
+        
+        error = _check_pipeline(cmds)
+        if error:
+            return [(None, error)] * len(cmds)
+        
+        results = []
+        async with self._lock:
+            if not self.writer:
+                return [(None, "Not connected")] * len(cmds)
+            
+            try:
+                self.writer.write(b''.join(cmd.encode() + b'\n' for cmd in cmds))
+                await self.writer.drain()
+                
+                for _ in cmds:
+                    result, error = _parse_response((await self._read_line()).strip())
+                    results.append((result.decode('utf-8', 'replace') if result is not None else None, error))
+            except asyncio.CancelledError:
+                self._abort()
+                raise
+            except Exception as e:
+                self._abort()
+                results.extend([(None, str(e))] * (len(cmds) - len(results)))
+        return results
+    
+    async def get(self, key: str) -> Tuple[Optional[str], Optional[str]]:
+        """Get value for key"""
+        if __debug__ and len(key) > _MAX_KV:
+            return None, "Key length exceeds 100 characters"
+        
+        result, error = await self._send_bytes(b"GET " + key.encode() + b"\n")
+        if error:
+            if "key not found" in str(error):
+                return None, None  # Key not found is not an error
+            return None, error
+        return result.decode('utf-8', 'replace'), None
+    
+    async def set(self, key: str, value: str, ttl: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+        """Set key to value with optional TTL"""
+        if __debug__ and (len(key) > _MAX_KV or len(value) > _MAX_KV):
+            return False, "Key or value length exceeds 100 characters"
+        
+        if ttl:
+            command = b"SET " + key.encode() + b" " + value.encode() + b" " + ttl.encode() + b"\n"
+        else:
+            command = b"SET " + key.encode() + b" " + value.encode() + b"\n"
+        
+        result, error = await self._send_bytes(command)
+        if error:
+            return False, error
+        return result == b"OK", None
+    
+    async def incr(self, key: str, ttl: Optional[str] = None) -> Tuple[Optional[int], Optional[str]]:
+        """Increment integer value by 1 with optional TTL"""
+        if __debug__ and len(key) > _MAX_KV:
+            return None, "Key length exceeds 100 characters"
+        
+        if ttl:
+            command = b"INCR " + key.encode() + b" " + ttl.encode() + b"\n"
+        else:
+            command = b"INCR " + key.encode() + b"\n"
+        
+        result, error = await self._send_bytes(command)
+        if error:
+            return None, error
+        
+        if result is None:
+            return None, "No response received"
+        
+        return _parse_int(result)
+    
+    async def delete(self, key: str) -> Tuple[bool, Optional[str]]:
+        """Delete key"""
+        if __debug__ and len(key) > _MAX_KV:
+            return False, "Key length exceeds 100 characters"
+        
+        result, error = await self._send_bytes(b"DEL " + key.encode() + b"\n")
+        if error:
+            if "key not found" in str(error):
+                return False, None  # Key not found is not an error
+            return False, error
+        return result == b"OK", None
+    
+    async def ping(self) -> Tuple[bool, Optional[str]]:
+        """Ping server"""
+        result, error = await self._send_bytes(_PING_BYTES)
+        if error:
+            return False, error
+        return result == b"PONG", None
+    
+    async def list(self) -> Tuple[Optional[list], Optional[str]]:
+        """List all keys with values and expiration timestamps"""
+        async with self._lock:
+            if not self.writer:
+                return None, "Not connected"
+            
+            try:
+                self.writer.write(_LIST_BYTES)
+                await self.writer.drain()
+                result, error = _parse_response((await self._read_line()).strip())
+                if error:
+                    return None, error
+                
+                if result is None or result.strip() == b"":
+                    return [], None
+                
+                # LIST spans multiple lines and is terminated by an empty line
+                lines = [result]
+                while True:
+                    line = await self._read_line()
+                    if line == b"":
+                        break
+                    lines.append(line)
+            except asyncio.CancelledError:
+                self._abort()
+                raise
+            except Exception as e:
+                self._abort()
+                return None, str(e)
+        
+        return _parse_list(lines), None
+    
+    async def close(self):
+        """Close connection"""
+        if self.writer:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except Exception:
+                pass
+            self.writer = None
+            self.reader = None
+            self._sock = None
+
+
+class ShrmplKVPool:
+    """Bounded pool of connected ShrmplKV clients for concurrent callers"""
+    
+    def __init__(self, host: str, port: int, min_size: int = 1, max_size: int = 10, timeout: float = 5):
+        self.host = host
+        self.port = port
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        # Used as a LIFO stack so the most recently used (warmest) connection goes out first
+        self._idle: List[ShrmplKV] = []
+        self._size = 0
+        self._closed = False
+        # Signalled whenever a connection is returned or a slot is freed
+        self._cond = threading.Condition()
+    
+    def connect(self) -> Tuple[bool, Optional[str]]:
+        """Open min_size connections up front"""
+        while self._size < self.min_size:
+            kv, error = self._create()
+            if error:
+                return False, error
+            self.put(kv)
+        return True, None
+    
+    def _reserve(self) -> bool:
+        """Claim a connection slot if the pool is below max_size (lock held)"""
+        if self._size >= self.max_size:
+            return False
+        self._size += 1
+        return True
+    
+    def _open(self) -> Tuple[Optional[ShrmplKV], Optional[str]]:
+        """Connect a client for an already reserved slot"""
+        kv = ShrmplKV(self.host, self.port)
+        success, error = kv.connect()
+        if not success:
+            self._release()
+            return None, error
+        return kv, None
+    
+    def _create(self) -> Tuple[Optional[ShrmplKV], Optional[str]]:
+        """Open a new connection if the pool is below max_size"""
+        with self._cond:
+            if self._closed:
+                return None, "Pool closed"
+            if not self._reserve():
+                return None, "Pool exhausted"
+        return self._open()
+    
+    def _release(self):
+        """Free a connection slot and wake one waiter"""
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+    
+    def _discard(self, kv: ShrmplKV):
+        """Close a connection and free its slot"""
+        kv.close()
+        self._release()
+    
+    def get(self) -> Tuple[Optional[ShrmplKV], Optional[str]]:
+        """Check out an idle connection, opening one if under max_size"""
+        deadline = time.monotonic() + self.timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    return None, "Pool closed"
+                if self._idle:
+                    return self._idle.pop(), None
+                if self._reserve():
+                    break
+                
+                # At capacity; wait for a connection to be returned or a slot freed
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None, "Pool exhausted"
+                self._cond.wait(remaining)
+        
+        # Connect outside the lock so other callers aren't blocked on the handshake
+        return self._open()
+    
+    def put(self, kv: ShrmplKV, failed: bool = False):
+        """Return a connection; after a failed operation it must answer PING to be kept"""
+        if self._closed or kv.socket is None:
+            self._discard(kv)
+            return
+        if failed:
+            ok, _ = kv.ping()
+            if not ok:
+                self._discard(kv)
+                return
+        with self._cond:
+            if not self._closed:
+                self._idle.append(kv)
+                self._cond.notify()
+                return
+        self._discard(kv)
+    
+    @contextmanager
+    def connection(self):
+        """Check out a connection for a with block; raises ConnectionError if none is available"""
+        kv, error = self.get()
+        if error:
+            raise ConnectionError(error)
+        
+        failed = False
+        try:
+            yield kv
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self.put(kv, failed)
+    
+    def close(self):
+        """Close idle connections; checked-out ones are closed when returned"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            # Wake waiters so they see the pool is closed
+            self._cond.notify_all()
+        for kv in idle:
+            self._discard(kv)
+
+
 class ShrmplLog:
     """Client for Shrmpl Log Server"""
     
@@ -193,46 +720,86 @@ class ShrmplLog:
         self.host = host
         self.port = port
         self.socket = None
+        self._quickack = hasattr(socket, 'TCP_QUICKACK')
+        self._prefix_cache: Dict[Tuple[str, str, str], bytes] = {}
     
     def connect(self) -> Tuple[bool, Optional[str]]:
         """Connect to Log server"""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(5)
+            _configure_socket(self.socket)
             self.socket.connect((self.host, self.port))
-            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if self._quickack:
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
             return True, None
         except Exception as e:
             return False, str(e)
     
-    def send(self, level: str, host: str, code: str, message: str) -> Tuple[bool, Optional[str]]:
-        """Send log message"""
-        try:
-            # Validate inputs
-            if len(level) != 4:
-                return False, "Level must be exactly 4 characters"
-            if len(host) > 32:
-                return False, "Host must be <= 32 characters"
-            if len(code) != 4:
-                return False, "Code must be exactly 4 characters"
-            if len(message) > 4096:
-                return False, "Message must be <= 4096 characters"
-            
-            # Format: [LVL(4)] [HOST(32)] [CODE(4)] [LEN(4)]: [MSG]\n
+    def _build_frame(self, level: str, host: str, code: str, message: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """Validate inputs and format one encoded log line"""
+        # Validate inputs
+        if len(level) != 4:
+            return None, "Level must be exactly 4 characters"
+        if len(host) > 32:
+            return None, "Host must be <= 32 characters"
+        if len(code) != 4:
+            return None, "Code must be exactly 4 characters"
+        if len(message) > 4096:
+            return None, "Message must be <= 4096 characters"
+        
+        if _build_log_frame is not None:
+            return _build_log_frame(level, host, code, message), None
+        
+        # Format: [LVL(4)] [HOST(32)] [CODE(4)] [LEN(4)]: [MSG]\n
+        # The padded prefix only depends on level/host/code, so cache it
+        key = (level, host, code)
+        prefix = self._prefix_cache.get(key)
+        if prefix is None:
             padded_host = host.ljust(32)[:32]  # Pad or truncate to 32 chars
             padded_level = level.ljust(4)[:4]    # Pad or truncate to 4 chars
             padded_code = code.ljust(4)[:4]      # Pad or truncate to 4 chars
-            msg_len = f"{len(message):04d}"     # Zero-padded length
+            prefix = f"[{padded_level}] [{padded_host}] [{padded_code}] [".encode()
             
-            log_line = f"[{padded_level}] [{padded_host}] [{padded_code}] [{msg_len}]: {message}\n"
+            # Evict the oldest entry so arbitrary hosts can't grow the cache
+            if len(self._prefix_cache) >= _LOG_PREFIX_CACHE_SIZE:
+                del self._prefix_cache[next(iter(self._prefix_cache))]
+            self._prefix_cache[key] = prefix
+        
+        msg_len = f"{len(message):04d}]: ".encode()  # Zero-padded length
+        return prefix + msg_len + message.encode() + b"\n", None
+    
+    def send(self, level: str, host: str, code: str, message: str) -> Tuple[bool, Optional[str]]:
+        """Send log message"""
+        try:
+            log_line, error = self._build_frame(level, host, code, message)
+            if error:
+                return False, error
             
             if self.socket:
-                self.socket.sendall(log_line.encode())
+                self.socket.sendall(log_line)
             return True, None
             
         except Exception as e:
             return False, str(e)
     
+    def send_many(self, records: List[Tuple[str, str, str, str]]) -> Tuple[int, Optional[str]]:
+        """Send (level, host, code, message) records with a single sendall"""
+        try:
+            buf = bytearray()
+            for i, (level, host, code, message) in enumerate(records):
+                log_line, error = self._build_frame(level, host, code, message)
+                if error:
+                    return 0, f"Record {i}: {error}"
+                buf += log_line
+            
+            if self.socket and buf:
+                self.socket.sendall(buf)
+            return len(records), None
+            
+        except Exception as e:
+            return 0, str(e)
+    
     def close(self):
         """Close connection"""
         if self.socket:
@@ -240,81 +807,203 @@ class ShrmplLog:
             self.socket = None
 
 
+class _ResumableHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPSConnection that offers a cached TLS session when (re)connecting"""
+    
+    def __init__(self, host: str, port: int, context: ssl.SSLContext, timeout: float,
+                 session: Optional[ssl.SSLSession] = None):
+        super().__init__(host, port, context=context, timeout=timeout)
+        self.ssl_context = context
+        self.session = session
+    
+    def connect(self):
+        """Open TCP, then handshake resuming self.session when possible"""
+        http.client.HTTPConnection.connect(self)
+        self.sock = self.ssl_context.wrap_socket(
+            self.sock, server_hostname=self.host, session=self.session
+        )
+
+
 class ShrmplVault:
     """Client for Shrmpl Vault Server"""
     
-    def __init__(self, server_url: str, cert_path: str, key_path: str, secret: str):
+    def __init__(self, server_url: str, cert_path: str, key_path: str, secret: str,
+                 ca_path: Optional[str] = None):
         self.server_url = server_url.rstrip('/')
         self.cert_path = cert_path
         self.key_path = key_path
         self.secret = secret
+        self.ca_path = ca_path
+        self._ssl_context = None
+        self._conn = None
+        self._tls_session = None
+        
+        url = urllib.parse.urlsplit(self.server_url)
+        self._host = url.hostname
+        self._port = url.port or 443
+        self._base_path = url.path
     
-    def connect(self) -> Tuple[bool, Optional[str]]:
-        """Validate certificates and test connection"""
-        try:
-            # Create SSL context
-            context = ssl.create_default_context()
+    def _get_context(self) -> ssl.SSLContext:
+        """Build the client SSL context once and reuse it"""
+        if self._ssl_context is None:
+            # Build a bare client context rather than create_default_context():
+            # the server certificate is still verified, but the hostname is not
+            # (the vault is often reached by IP), TLS < 1.2 is never offered and
+            # TLS 1.2 is limited to ECDHE AEAD suites
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
             context.check_hostname = False
             context.verify_mode = ssl.CERT_REQUIRED
+            context.minimum_version = ssl.TLSVersion.TLSv1_2
+            context.set_ciphers('ECDHE+AESGCM:ECDHE+CHACHA20')
+            if self.ca_path:
+                context.load_verify_locations(cafile=self.ca_path)
+            else:
+                context.load_default_certs()
             
             # Load client certificates
             context.load_cert_chain(self.cert_path, self.key_path)
-            
+            self._ssl_context = context
+        return self._ssl_context
+    
+    def _get_conn(self) -> _ResumableHTTPSConnection:
+        """Return the persistent HTTPS connection, creating it if needed"""
+        if self._conn is None:
+            self._conn = _ResumableHTTPSConnection(
+                self._host, self._port, self._get_context(), 10, session=self._tls_session
+            )
+        return self._conn
+    
+    def _send(self, conn: _ResumableHTTPSConnection, path: str) -> http.client.HTTPResponse:
+        """Issue GET on conn and remember its TLS session for reconnects"""
+        conn.request('GET', path)
+        response = conn.getresponse()
+        
+        # TLS 1.3 tickets arrive after the handshake, so grab the session
+        # once the server has replied
+        if conn.sock:
+            conn.session = self._tls_session = conn.sock.session
+        return response
+    
+    def _reset_conn(self):
+        """Drop the persistent connection so the next request reconnects"""
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+    
+    def _request(self, filename: str) -> http.client.HTTPResponse:
+        """Send GET for filename over the keep-alive connection"""
+        path = f"{self._base_path}/{filename}?secret={self.secret}"
+        reused = self._conn is not None
+        try:
+            return self._send(self._get_conn(), path)
+        except (http.client.HTTPException, OSError):
+            self._reset_conn()
+            if not reused:
+                raise
+        
+        # Server may have closed an idle connection; retry once on a fresh one
+        try:
+            return self._send(self._get_conn(), path)
+        except (http.client.HTTPException, OSError):
+            self._reset_conn()
+            raise
+    
+    @staticmethod
+    def _status_error(status: int, reason: str) -> str:
+        """Map an HTTP error status to an error message"""
+        if status == 404:
+            return "File not found"
+        elif status == 401:
+            return "Unauthorized - invalid certificate or secret"
+        elif status == 429:
+            return "Rate limit exceeded"
+        else:
+            return f"HTTP error: {status} - {reason}"
+    
+    def connect(self) -> Tuple[bool, Optional[str]]:
+        """Validate certificates and test connection"""
+        try:
             # Test connection with a simple request
-            test_url = f"{self.server_url}/test?secret={self.secret}"
-            req = urllib.request.Request(test_url)
+            response = self._request("test")
+            response.read()
             
-            try:
-                with urllib.request.urlopen(req, context=context, timeout=10) as response:
-                    if response.status == 404:
-                        # 404 is expected for test file, means connection works
-                        return True, None
-                    else:
-                        return False, f"Test failed with status: {response.status}"
-            except urllib.error.HTTPError as e:
-                if e.code == 404:
-                    # 404 is expected for test file
-                    return True, None
-                else:
-                    return False, f"HTTP error: {e.code} - {e.reason}"
+            if response.status == 404:
+                # 404 is expected for test file, means connection works
+                return True, None
+            elif response.status >= 400:
+                return False, f"HTTP error: {response.status} - {response.reason}"
+            else:
+                return False, f"Test failed with status: {response.status}"
                     
+        except (http.client.HTTPException, OSError) as e:
+            self._reset_conn()
+            return False, str(e)
         except Exception as e:
             return False, str(e)
     
     def get_config(self, filename: str) -> Tuple[Optional[str], Optional[str]]:
         """Get configuration file from vault"""
+        chunks, error = self.get_config_stream(filename)
+        if error:
+            return None, error
+        
         try:
-            # Create SSL context
-            context = ssl.create_default_context()
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_REQUIRED
-            context.load_cert_chain(self.cert_path, self.key_path)
-            
-            # Make request
-            url = f"{self.server_url}/{filename}?secret={self.secret}"
-            req = urllib.request.Request(url)
+            content = ''.join(chunks)
+            return content, None
+        except (http.client.HTTPException, OSError) as e:
+            self._reset_conn()
+            return None, str(e)
+        except Exception as e:
+            return None, str(e)
+    
+    def get_config_stream(self, filename: str) -> Tuple[Optional[Iterator[str]], Optional[str]]:
+        """Get configuration file from vault as an iterator of decoded chunks"""
+        try:
+            response = self._request(filename)
             
-            with urllib.request.urlopen(req, context=context, timeout=10) as response:
-                if response.status == 200:
-                    content = response.read().decode()
-                    return content, None
-                elif response.status == 404:
-                    return None, "File not found"
-                elif response.status == 401:
-                    return None, "Unauthorized - invalid certificate or secret"
-                elif response.status == 429:
-                    return None, "Rate limit exceeded"
-                else:
-                    return None, f"HTTP error: {response.status}"
+            if response.status != 200:
+                response.read()
+                return None, self._status_error(response.status, response.reason)
                     
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                return None, "File not found"
-            elif e.code == 401:
-                return None, "Unauthorized - invalid certificate or secret"
-            elif e.code == 429:
-                return None, "Rate limit exceeded"
-            else:
-                return None, f"HTTP error: {e.code} - {e.reason}"
+        except (http.client.HTTPException, OSError) as e:
+            self._reset_conn()
+            return None, str(e)
         except Exception as e:
-            return None, str(e)
\ No newline at end of file
+            return None, str(e)
+        
+        return self._iter_body(self._conn, response), None
+    
+    def _iter_body(self, conn: _ResumableHTTPSConnection, response: http.client.HTTPResponse) -> Iterator[str]:
+        """Decode a response body incrementally in fixed-size reads"""
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        done = False
+        try:
+            while True:
+                chunk = response.read(_VAULT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                text = decoder.decode(chunk)
+                if text:
+                    yield text
+            
+            # read(amt) returns b"" on early EOF instead of raising, so check
+            # that the body is complete and still ours before calling it done
+            if response.length:
+                raise http.client.IncompleteRead(b'', response.length)
+            if self._conn is not conn:
+                raise http.client.HTTPException("Connection closed while reading response")
+            done = True
+            text = decoder.decode(b'', final=True)
+            if text:
+                yield text
+        finally:
+            # A partially read body leaves this keep-alive connection unusable;
+            # by now the client may have moved on to a newer one, so leave that be
+            if not done:
+                response.close()
+                if self._conn is conn:
+                    self._reset_conn()
+    
+    def close(self):
+        """Close connection"""
+        self._reset_conn()